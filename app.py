@@ -1,14 +1,36 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, jsonify, request
 import RPi.GPIO as GPIO
+import asyncio
 import threading
 import time
+import itertools
+import json
 import sys
 import subprocess
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import yaml
 import os
 import argparse
 
+# orjson is optional: much faster serialization, but no prebuilt wheels
+# for ARMv6 (Pi Zero), so fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def json_dumps(obj):
+        """Serialize to a JSON string using orjson"""
+        # OPT_NON_STR_KEYS: pin dicts are keyed by int pin numbers
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def json_dumps(obj):
+        """Serialize to a JSON string using stdlib json"""
+        return json.dumps(obj)
+
 # Import component system
 from components import ComponentRegistry
 from components.producers import DHT22Component, DHT11Component
@@ -24,18 +46,49 @@ SUDO_PREFIX = [] if is_root() else ['sudo']
 app = Flask(__name__)
 app.logger.disabled = True  # Disable Flask's request logging
 
+# Thread diagnostics go through logging so the per-read chatter can be
+# gated out: at the default INFO level the read loops emit nothing,
+# keeping the GIL and stdio lock free of per-sample formatting
+logger = logging.getLogger('gpioviz')
+
+# Route jsonify through orjson when available so every endpoint benefits
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # GPIO setup
 GPIO.setmode(GPIO.BOARD)
 GPIO.setwarnings(False)
 
 # Pin state storage
 pin_states = {}
-flashing_pins = {}
-flash_threads = {}
+
+# Guards bulk multi-pin updates (reset, config load) against a concurrent
+# /api/pins snapshot build. Single-field writes such as one pin's state
+# are already atomic under the GIL and the UI tolerates momentary skew,
+# so per-toggle paths intentionally stay lock-free
+pin_states_lock = threading.Lock()
+
+# Flash scheduling: a single asyncio event loop in one background thread
+# multiplexes all flashing pins via timer callbacks, instead of spawning
+# one thread per flashing pin
+flash_loop = asyncio.new_event_loop()
+flash_handles = {}  # pin -> asyncio.TimerHandle
 
 # Clock state
 clock_running = False
 clock_thread = None
+clock_stop_event = threading.Event()  # wakes the clock thread on stop
 
 # Component system
 component_registry = ComponentRegistry(definitions_file='components/definitions.json')
@@ -44,9 +97,9 @@ component_registry.register_class('dht22', DHT22Component)
 component_registry.register_class('dht11', DHT11Component)
 
 # Component reading state
-component_threads = {}  # pin -> thread
-component_running = {}  # pin -> bool
-component_data = {}     # pin -> latest data
+component_threads = {}      # pin -> thread
+component_stop_events = {}  # pin -> Event; set() wakes the read loop to exit
+component_data = {}         # pin -> latest data
 
 # HAT mode clock display using left 3 columns for tens, right 3 columns for ones
 # Creates digit patterns in 4x3 grids to display seconds
@@ -119,13 +172,22 @@ TENS_GPIO_TO_PIN = {
     2: 3, 3: 5, 4: 7         # Row 3
 }
 
-def get_all_clock_pins():
-    """Get all pins used by the clock display"""
-    return list(ONES_GPIO_TO_PIN.values()) + list(TENS_GPIO_TO_PIN.values())
+# Board pins lit for each digit, precomputed once from the GPIO-number
+# patterns above so the clock tick never re-maps GPIO numbers to pins
+TENS_DIGIT_PINS = {
+    digit: tuple(TENS_GPIO_TO_PIN[g] for g in pattern if g in TENS_GPIO_TO_PIN)
+    for digit, pattern in TENS_PATTERNS_GPIO.items()
+}
+ONES_DIGIT_PINS = {
+    digit: tuple(ONES_GPIO_TO_PIN[g] for g in pattern if g in ONES_GPIO_TO_PIN)
+    for digit, pattern in ONES_PATTERNS_GPIO.items()
+}
 
 def clock_display_thread():
     """Thread function to display seconds as two digits on GPIO LEDs"""
-    global clock_running, pin_changes
+    global clock_running
+
+    lit = set()  # pins the clock is currently driving HIGH
 
     while clock_running:
         # Get current seconds (0-59)
@@ -136,54 +198,56 @@ def clock_display_thread():
         tens_digit = seconds // 10
         ones_digit = seconds % 10
 
-        # Turn off all clock pins first (skip pins with components)
-        all_clock_pins = get_all_clock_pins()
-        for pin in all_clock_pins:
-            if pin in GPIO_PINS and not pin_states[pin].get('component', False):
-                ensure_pin_setup(pin, 'OUT')
-                GPIO.output(pin, GPIO.LOW)
+        # Desired pattern for this second; skip pins claimed by a
+        # component or reconfigured as inputs since the clock started
+        desired = {pin for pin in TENS_DIGIT_PINS[tens_digit]
+                   if pin_states[pin]['mode'] == 'OUT'}
+        desired.update(pin for pin in ONES_DIGIT_PINS[ones_digit]
+                       if pin_states[pin]['mode'] == 'OUT')
+
+        # Delta update: only write pins whose level actually changes, so
+        # segments shared between consecutive digits never blink off
+        lit = {pin for pin in lit if pin_states[pin]['mode'] == 'OUT'}
+        off_pins = list(lit - desired)
+        on_pins = list(desired - lit)
+        if off_pins:
+            GPIO.output(off_pins, GPIO.LOW)
+            for pin in off_pins:
                 pin_states[pin]['state'] = 0
-
-        # Display tens digit on left 3 columns (skip pins with components)
-        tens_gpio_pattern = TENS_PATTERNS_GPIO.get(tens_digit, [])
-        for gpio_num in tens_gpio_pattern:
-            pin = TENS_GPIO_TO_PIN.get(gpio_num)
-            if pin and pin in GPIO_PINS and not pin_states[pin].get('component', False):
-                ensure_pin_setup(pin, 'OUT')
-                GPIO.output(pin, GPIO.HIGH)
+        if on_pins:
+            GPIO.output(on_pins, GPIO.HIGH)
+            for pin in on_pins:
                 pin_states[pin]['state'] = 1
+        lit = desired
 
-        # Display ones digit on right 3 columns (skip pins with components)
-        ones_gpio_pattern = ONES_PATTERNS_GPIO.get(ones_digit, [])
-        for gpio_num in ones_gpio_pattern:
-            pin = ONES_GPIO_TO_PIN.get(gpio_num)
-            if pin and pin in GPIO_PINS and not pin_states[pin].get('component', False):
-                ensure_pin_setup(pin, 'OUT')
-                GPIO.output(pin, GPIO.HIGH)
-                pin_states[pin]['state'] = 1
+        if off_pins or on_pins:
+            mark_pins_dirty()
 
-        # Update every second
-        time.sleep(1)
+        # Sleep until the next wall-clock second boundary rather than a
+        # flat 1s, so the display never drifts or double-updates the same
+        # second; wait() returns early the moment the clock is stopped
+        next_tick = int(time.time()) + 1
+        if clock_stop_event.wait(max(0, next_tick - time.time())):
+            break
 
-def component_read_thread(pin):
+def component_read_thread(pin, stop_event):
     """Thread function to periodically read component data"""
-    global component_running, component_data
+    global component_data
 
-    print(f"[THREAD] Component thread started for pin {pin}")
+    logger.info("Component thread started for pin %d", pin)
 
     # Initial delay to let sensor stabilize after GPIO setup
     # Critical for sensors like DHT22 that need time after pin state changes
-    print(f"[THREAD] Waiting 2 seconds for sensor stabilization...")
-    time.sleep(2)
+    if stop_event.wait(2):
+        logger.info("Component thread stopped for pin %d", pin)
+        return
 
-    print(f"[THREAD] Starting read loop for pin {pin}")
     read_count = 0
-    while component_running.get(pin, False):
+    while not stop_event.is_set():
         component = component_registry.get_component(pin)
         if component:
             try:
                 read_count += 1
-                print(f"[THREAD] Read #{read_count} for pin {pin}")
 
                 # Read data from component
                 data = component.read()
@@ -195,23 +259,52 @@ def component_read_thread(pin):
                     'component_type': component.__class__.__name__
                 }
 
-                print(f"[THREAD] Stored data: {data}")
-            except Exception as e:
-                print(f"[THREAD] ERROR reading component on pin {pin}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.debug("Read #%d for pin %d: %s", read_count, pin, data)
+            except Exception:
+                logger.exception("Error reading component on pin %d", pin)
 
-        # Update interval (could be configurable per component)
-        time.sleep(2)
+        # Update interval (could be configurable per component);
+        # wait() returns early the moment the component is stopped
+        if stop_event.wait(2):
+            break
 
-    print(f"[THREAD] Component thread stopped for pin {pin}")
+    logger.info("Component thread stopped for pin %d", pin)
+
+def stop_component_thread(pin):
+    """Signal a component read thread to stop and wait for it to exit
+
+    The stop event wakes the thread out of its read-interval wait, so
+    the join returns immediately instead of up to 2s later.
+    """
+    event = component_stop_events.pop(pin, None)
+    if event:
+        event.set()
+    thread = component_threads.pop(pin, None)
+    if thread:
+        thread.join()
+
+class AtomicCounter:
+    """Lock-free monotonic counter for stats shared across threads
+
+    next() on itertools.count executes atomically in C, so increments
+    from concurrent request threads need no lock and never contend.
+    """
+
+    def __init__(self):
+        self._count = itertools.count(1)
+        self.value = 0
+
+    def increment(self):
+        self.value = next(self._count)
 
 # Stats tracking
 start_time = datetime.now()
-request_count = 0
-pin_changes = 0
+start_monotonic = time.monotonic()  # uptime base, immune to wall-clock steps
+request_count = AtomicCounter()
+pin_changes = AtomicCounter()
 spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
-spinner_idx = 0
+# cycle() yields the next frame in C - no index bookkeeping or modulo
+_spinner = itertools.cycle(c.encode() for c in spinner_chars)
 app_ready = False
 
 # Raspberry Pi Zero 40-pin header
@@ -245,6 +338,15 @@ GPIO_PINS = {
     40: 'GPIO21'
 }
 
+# Frozen view of the valid pin numbers for request validation
+GPIO_PIN_SET = frozenset(GPIO_PINS)
+
+# All pins the clock display can drive, filtered to valid GPIO pins once
+# at import; the toggle paths iterate this instead of rebuilding lists
+ALL_CLOCK_PINS = tuple(pin for pin in
+                       list(ONES_GPIO_TO_PIN.values()) + list(TENS_GPIO_TO_PIN.values())
+                       if pin in GPIO_PINS)
+
 # BOARD (physical pin) to BCM GPIO number mapping
 # Some libraries like Adafruit_DHT only use BCM numbering
 BOARD_TO_BCM = {
@@ -254,6 +356,10 @@ BOARD_TO_BCM = {
     38: 20, 40: 21
 }
 
+# Component types whose data pin is configured in BOARD numbering but
+# driven in BCM (the Adafruit_DHT library only accepts BCM)
+DHT_COMPONENT_TYPES = frozenset(('dht22', 'dht11'))
+
 # Pin alternative functions mapping
 PIN_ALT_FUNCTIONS = {
     3: ['I2C1 SDA', 'GPIO'],
@@ -274,6 +380,20 @@ PIN_ALT_FUNCTIONS = {
     40: ['SPI1 SCLK', 'PCM DOUT', 'GPIO'],
 }
 
+# GPIO_PINS never changes at runtime, so serialize it once
+GPIO_PINS_JSON = json_dumps(GPIO_PINS)
+
+# /api/pins response cache: the body is rebuilt only when pin state has
+# actually changed, tracked by a version counter bumped on every mutation
+state_version = 0
+_pins_cache_version = -1
+_pins_cache_body = None
+
+def mark_pins_dirty():
+    """Invalidate the cached /api/pins response after a pin state change"""
+    global state_version
+    state_version += 1
+
 # Initialize pin states (setup pins lazily on first use)
 for pin in GPIO_PINS.keys():
     alt_funcs = PIN_ALT_FUNCTIONS.get(pin, ['GPIO'])
@@ -287,71 +407,236 @@ for pin in GPIO_PINS.keys():
         'component': False  # Track if pin has a component assigned
     }
 
+# Direction each pin was last configured with ('OUT'/'IN'), so repeated
+# ensure_pin_setup calls on hot paths skip the GPIO.setup round-trip
+_pin_setup_mode = {}
+
+# Pins currently in INPUT mode that /api/pins still has to sample -
+# only those where edge detection could not be registered. Kept in sync
+# by set_pin_mode_state() so the poll sweep never scans the full table
+input_pins = set()
+
+# Input pins with an RPi.GPIO edge callback registered: their state is
+# pushed from the event thread, so the poll sweep skips them entirely
+event_pins = set()
+
+def _on_input_edge(pin):
+    """Edge callback (runs on RPi.GPIO's event thread)"""
+    if pin_states[pin]['mode'] != 'IN':
+        return
+    state = GPIO.input(pin)
+    if state != pin_states[pin]['state']:
+        pin_states[pin]['state'] = state
+        mark_pins_dirty()
+
+def set_pin_mode_state(pin, mode):
+    """Record a pin's mode and keep the input-pin bookkeeping in sync"""
+    pin_states[pin]['mode'] = mode
+    if mode == 'IN':
+        # Prefer push updates via edge detection: input changes land
+        # within microseconds instead of at the next poll, and
+        # /api/pins never has to call GPIO.input. Fall back to the
+        # poll sweep if event registration fails (e.g. pin busy)
+        if pin not in event_pins:
+            try:
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=_on_input_edge)
+                event_pins.add(pin)
+                input_pins.discard(pin)
+            except Exception:
+                input_pins.add(pin)
+    else:
+        if pin in event_pins:
+            try:
+                GPIO.remove_event_detect(pin)
+            except Exception:
+                pass
+            event_pins.discard(pin)
+        input_pins.discard(pin)
+
 def ensure_pin_setup(pin, mode='OUT'):
     """Ensure a pin is properly set up before use"""
+    if _pin_setup_mode.get(pin) == mode:
+        return
     try:
         if mode == 'OUT':
             GPIO.setup(pin, GPIO.OUT)
             GPIO.output(pin, GPIO.LOW)
         else:
             GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        _pin_setup_mode[pin] = mode
     except Exception as e:
         print(f"Warning: Could not setup pin {pin}: {e}")
 
+# Eagerly configure every pin once at startup (all default to OUT/LOW),
+# so hot paths never pay a first-use GPIO.setup
+for pin in GPIO_PINS.keys():
+    ensure_pin_setup(pin, 'OUT')
+
+# Throttle terminal writes: bursts of requests collapse into one redraw
+STATUS_MIN_INTERVAL = 0.1  # seconds
+
+# Wakes the background status printer when a redraw is wanted
+_status_event = threading.Event()
+
+# Formatted uptime cached per whole second (pre-encoded)
+_uptime_cache = (-1, b'')
+
+# Pre-encoded fragments of the status line; only the counters are
+# formatted per redraw, and the write goes straight to stderr's buffer
+_STATUS_READY = '\r\033[K✓ Server ready - waiting for client connection...'.encode()
+_STATUS_HEAD = b'\r\033[K'
+
+# Active/flashing pin counts keyed to the state version they were
+# computed at, so the status line only rescans pin_states after a change
+_counts_cache = (-1, 0, 0)  # (state_version, active_count, flashing_count)
+
+def get_pin_counts():
+    """Return (active_count, flashing_count), recomputing only on change"""
+    global _counts_cache
+    if _counts_cache[0] != state_version:
+        version = state_version
+        flashing = sum(1 for p in pin_states.values() if p.get('flashing', False))
+        active = sum(1 for p in pin_states.values() if p.get('state', 0) == 1 and p.get('mode', 'OUT') == 'OUT')
+        _counts_cache = (version, active, flashing)
+    return _counts_cache[1], _counts_cache[2]
+
 def update_status_line():
-    """Update terminal status line with running stats"""
-    global spinner_idx, request_count
+    """Request a status line redraw from the background printer
+
+    Request threads only set an event; the formatting and stderr write
+    happen on the printer thread, off the request path.
+    """
+    _status_event.set()
+
+def _write_status_line():
+    """Format and write the status line (runs on the printer thread)"""
+    now = time.monotonic()
 
     if not app_ready:
         # Show "Ready" message until first client connects
-        sys.stderr.write("\r\033[K✓ Server ready - waiting for client connection...")
+        sys.stderr.buffer.write(_STATUS_READY)
         sys.stderr.flush()
         return
 
-    uptime = datetime.now() - start_time
-    hours = int(uptime.total_seconds() // 3600)
-    minutes = int((uptime.total_seconds() % 3600) // 60)
-    seconds = int(uptime.total_seconds() % 60)
+    # One monotonic subtraction gives the uptime; the formatted string
+    # only changes once per second, so cache it
+    global _uptime_cache
+    total_seconds = int(now - start_monotonic)
+    if total_seconds != _uptime_cache[0]:
+        minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        _uptime_cache = (total_seconds, b'%02d:%02d:%02d' % (hours, minutes, seconds))
+    uptime_bytes = _uptime_cache[1]
+
+    active_count, flashing_count = get_pin_counts()
+
+    spinner = next(_spinner)
+
+    # Clear the line and write status in one buffer write
+    status = b''.join((
+        _STATUS_HEAD, spinner,
+        b' Uptime: ', uptime_bytes,
+        b' | Requests: ', b'%d' % request_count.value,
+        b' | Pin changes: ', b'%d' % pin_changes.value,
+        b' | Active: ', b'%d' % active_count,
+        b' | Flashing: ', b'%d' % flashing_count,
+    ))
+    sys.stderr.buffer.write(status)
+    sys.stderr.flush()
 
-    flashing_count = sum(1 for p in pin_states.values() if p.get('flashing', False))
-    active_count = sum(1 for p in pin_states.values() if p.get('state', 0) == 1 and p.get('mode', 'OUT') == 'OUT')
+def _status_printer():
+    """Background thread: redraws the status line when requested
+
+    Sleeping STATUS_MIN_INTERVAL after each write coalesces redraw
+    bursts into a single update.
+    """
+    while True:
+        _status_event.wait()
+        _status_event.clear()
+        _write_status_line()
+        time.sleep(STATUS_MIN_INTERVAL)
+
+_status_printer_thread = threading.Thread(target=_status_printer)
+_status_printer_thread.daemon = True
+_status_printer_thread.start()
+
+def count_user_action():
+    """Count a user-initiated request and refresh the status line
+
+    Called explicitly from the user-action routes instead of a
+    before_request hook, so polled endpoints (/api/pins, /api/version,
+    /api/component/*) and static files never pay for the dispatch.
+    Component polling can interfere with timing-sensitive sensors like
+    DHT22, which is another reason those routes stay uncounted.
+    """
+    request_count.increment()
+    update_status_line()
 
-    spinner = spinner_chars[spinner_idx]
-    spinner_idx = (spinner_idx + 1) % len(spinner_chars)
+def _run_flash_loop():
+    """Run the shared flash event loop (daemon thread)"""
+    asyncio.set_event_loop(flash_loop)
+    flash_loop.run_forever()
 
-    # Clear the line and write status
-    status = f"\r\033[K{spinner} Uptime: {hours:02d}:{minutes:02d}:{seconds:02d} | Requests: {request_count} | Pin changes: {pin_changes} | Active: {active_count} | Flashing: {flashing_count}"
-    sys.stderr.write(status)
-    sys.stderr.flush()
+flash_loop_thread = threading.Thread(target=_run_flash_loop)
+flash_loop_thread.daemon = True
+flash_loop_thread.start()
 
-@app.before_request
-def track_request():
-    """Track each request (user actions only, not polling)"""
-    global request_count
-    # Only count user actions: page loads, pin changes, mode changes, etc.
-    # Exclude /api/pins (polling), /api/component/*/data (component polling), and static files
-    # Component polling can interfere with timing-sensitive sensors like DHT22
-    if request.path == '/' or (request.path.startswith('/api/')
-                                and request.path != '/api/pins'
-                                and request.path != '/api/version'
-                                and '/component/' not in request.path):
-        request_count += 1
-        update_status_line()
+def _schedule_flash(pin, speed_ms, deadline=None):
+    """Toggle a flashing pin and reschedule (runs on the flash loop)
 
-def flash_pin(pin, speed_ms):
-    """Flash a pin at specified speed"""
-    ensure_pin_setup(pin, 'OUT')
-    while flashing_pins.get(pin, False):
-        GPIO.output(pin, GPIO.HIGH)
-        pin_states[pin]['state'] = 1
-        time.sleep(speed_ms / 1000.0)
+    Reschedules against an absolute monotonic deadline rather than a
+    relative delay, so callback latency doesn't accumulate as drift.
+    """
+    if pin not in flash_handles:
+        return  # Cancelled between callbacks
+    state = 0 if pin_states[pin]['state'] else 1
+    GPIO.output(pin, GPIO.HIGH if state else GPIO.LOW)
+    pin_states[pin]['state'] = state
+    mark_pins_dirty()
+
+    period = speed_ms / 1000.0
+    now = flash_loop.time()
+    deadline = (deadline if deadline is not None else now) + period
+    if deadline < now:
+        # Fell badly behind (e.g. system pause) - realign instead of bursting
+        deadline = now + period
+    flash_handles[pin] = flash_loop.call_at(deadline, _schedule_flash, pin, speed_ms, deadline)
+
+def _cancel_flash(pin, turn_off):
+    """Cancel a pin's flash timer (runs on the flash loop)"""
+    handle = flash_handles.pop(pin, None)
+    if handle:
+        handle.cancel()
+    if turn_off:
         GPIO.output(pin, GPIO.LOW)
         pin_states[pin]['state'] = 0
-        time.sleep(speed_ms / 1000.0)
+        mark_pins_dirty()
+
+def start_flashing(pin, speed_ms):
+    """Start flashing a pin via the shared flash loop"""
+    ensure_pin_setup(pin, 'OUT')
+    pin_states[pin]['flashing'] = True
+    mark_pins_dirty()
+    flash_handles[pin] = None  # Claim slot so _schedule_flash runs
+    flash_loop.call_soon_threadsafe(_schedule_flash, pin, speed_ms)
+
+def stop_flashing(pin, turn_off=True):
+    """Stop flashing a pin; optionally drive it LOW afterwards"""
+    if not pin_states[pin]['flashing']:
+        return
+    pin_states[pin]['flashing'] = False
+    mark_pins_dirty()
+    flash_loop.call_soon_threadsafe(_cancel_flash, pin, turn_off)
+
+# index.html contains no template syntax, so read it once at startup
+# rather than rendering it through Jinja on every page load
+with open(os.path.join('templates', 'index.html'), 'rb') as f:
+    INDEX_HTML = f.read()
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    count_user_action()
+    return app.response_class(INDEX_HTML, mimetype='text/html')
 
 @app.route('/api/pins', methods=['GET'])
 def get_pins():
@@ -363,80 +648,95 @@ def get_pins():
         app_ready = True
         update_status_line()
 
-    # Read actual state of all INPUT pins
-    # Skip pins with components (they manage their own state)
-    for pin in GPIO_PINS.keys():
-        if pin_states[pin]['mode'] == 'IN' and not pin_states[pin].get('component', False):
-            pin_states[pin]['state'] = GPIO.input(pin)
-
-    return jsonify({
-        'pins': pin_states,
-        'gpio_map': GPIO_PINS
-    })
+    # Read actual state of INPUT pins without edge detection (pins with
+    # working edge callbacks are pushed from the event thread instead).
+    # Pins with components never enter input_pins (they manage their own state)
+    changed = False
+    for pin in input_pins:
+        state = GPIO.input(pin)
+        if state != pin_states[pin]['state']:
+            pin_states[pin]['state'] = state
+            changed = True
+    if changed:
+        mark_pins_dirty()
+
+    # Rebuild the response body only when pin state has changed since the
+    # last poll; GPIO_PINS is pre-serialized at startup
+    global _pins_cache_version, _pins_cache_body
+    if _pins_cache_body is None or _pins_cache_version != state_version:
+        version = state_version
+        with pin_states_lock:
+            body = '{"pins": %s, "gpio_map": %s}' % (json_dumps(pin_states), GPIO_PINS_JSON)
+        _pins_cache_body = body
+        _pins_cache_version = version
+
+    # The state version doubles as an ETag: pollers that saw this version
+    # already get an empty 304 instead of the full body
+    etag = '"%d"' % _pins_cache_version
+    if request.headers.get('If-None-Match') == etag:
+        return app.response_class(status=304, headers={'ETag': etag})
+
+    response = app.response_class(_pins_cache_body, mimetype='application/json')
+    response.headers['ETag'] = etag
+    # no-cache = revalidate every poll, so the browser sends If-None-Match
+    # and reuses its cached body on 304
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/api/pin/<int:pin>/set', methods=['POST'])
 def set_pin(pin):
     """Set pin state"""
-    global pin_changes
-
-    if pin not in GPIO_PINS:
+    count_user_action()
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     data = request.json
     state = data.get('state', 0)
 
     # Stop flashing if active
-    if pin_states[pin]['flashing']:
-        flashing_pins[pin] = False
-        if pin in flash_threads:
-            flash_threads[pin].join()
-        pin_states[pin]['flashing'] = False
+    stop_flashing(pin, turn_off=False)
 
     ensure_pin_setup(pin, 'OUT')
     GPIO.output(pin, GPIO.HIGH if state else GPIO.LOW)
     pin_states[pin]['state'] = state
-    pin_changes += 1
+    pin_changes.increment()
+    mark_pins_dirty()
 
     return jsonify({'success': True, 'pin': pin, 'state': state})
 
 @app.route('/api/pin/<int:pin>/mode', methods=['POST'])
 def set_pin_mode(pin):
     """Set pin mode (IN/OUT)"""
-    global pin_changes
-
-    if pin not in GPIO_PINS:
+    count_user_action()
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     data = request.json
     mode = data.get('mode', 'OUT')
-    pin_changes += 1
+    pin_changes.increment()
 
     # Stop flashing if active
-    if pin_states[pin]['flashing']:
-        flashing_pins[pin] = False
-        if pin in flash_threads:
-            flash_threads[pin].join()
-        pin_states[pin]['flashing'] = False
+    stop_flashing(pin, turn_off=False)
 
     if mode == 'IN':
         # Set up input with pull-down resistor so it reads LOW by default
-        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        ensure_pin_setup(pin, 'IN')
         pin_states[pin]['state'] = GPIO.input(pin)
     else:
-        GPIO.setup(pin, GPIO.OUT)
+        ensure_pin_setup(pin, 'OUT')
         GPIO.output(pin, GPIO.LOW)
         pin_states[pin]['state'] = 0
 
-    pin_states[pin]['mode'] = mode
+    set_pin_mode_state(pin, mode)
+    mark_pins_dirty()
 
     return jsonify({'success': True, 'pin': pin, 'mode': mode})
 
 @app.route('/api/pin/<int:pin>/flash', methods=['POST'])
 def toggle_flash(pin):
     """Toggle pin flashing"""
-    global pin_changes
-
-    if pin not in GPIO_PINS:
+    count_user_action()
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     data = request.json
@@ -444,35 +744,24 @@ def toggle_flash(pin):
     speed = data.get('speed', 500)
 
     pin_states[pin]['flash_speed'] = speed
-    pin_changes += 1
+    pin_changes.increment()
+    mark_pins_dirty()
 
     if flash_enabled:
         # Start flashing
         if not pin_states[pin]['flashing']:
-            ensure_pin_setup(pin, 'OUT')
-            pin_states[pin]['flashing'] = True
-            flashing_pins[pin] = True
-            thread = threading.Thread(target=flash_pin, args=(pin, speed))
-            thread.daemon = True
-            flash_threads[pin] = thread
-            thread.start()
+            start_flashing(pin, speed)
     else:
-        # Stop flashing
-        if pin_states[pin]['flashing']:
-            flashing_pins[pin] = False
-            if pin in flash_threads:
-                flash_threads[pin].join()
-            pin_states[pin]['flashing'] = False
-            ensure_pin_setup(pin, 'OUT')
-            GPIO.output(pin, GPIO.LOW)
-            pin_states[pin]['state'] = 0
+        # Stop flashing (pin is driven LOW by the flash loop)
+        stop_flashing(pin)
 
     return jsonify({'success': True, 'pin': pin, 'flashing': pin_states[pin]['flashing']})
 
 @app.route('/api/pin/<int:pin>/read', methods=['GET'])
 def read_pin(pin):
     """Read pin state (for input mode)"""
-    if pin not in GPIO_PINS:
+    count_user_action()
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     if pin_states[pin]['mode'] == 'IN':
@@ -482,12 +771,38 @@ def read_pin(pin):
 
     return jsonify({'success': True, 'pin': pin, 'state': pin_states[pin]['state']})
 
+# Peripherals already enabled this run; dtparam state survives until
+# reboot, so repeat enabling is pure subprocess overhead
+_enabled_peripherals = set()
+
+# Single background worker for dtparam/modprobe so peripheral toggles
+# return immediately instead of waiting on module loading
+_sys_worker = ThreadPoolExecutor(max_workers=1)
+
+def _run_peripheral_command(mode, pin, cmd):
+    """Run a peripheral enable shell command (on the background worker)
+
+    cmd is a single shell string, so multi-step enables cost one fork
+    instead of one per tool. Failures are reported here since the
+    request handler has already returned.
+    """
+    try:
+        result = subprocess.run(SUDO_PREFIX + ['sh', '-c', cmd],
+                                check=False, capture_output=True)
+        if result.returncode != 0:
+            stderr_msg = result.stderr.decode().strip() or f"exit code {result.returncode}"
+            print(f"Warning: Could not enable {mode} for pin {pin}: {stderr_msg}")
+            return
+    except Exception as e:
+        print(f"Warning: Could not enable {mode} for pin {pin}: {e}")
+        return
+    print(f"Enabled {mode} for pin {pin}")
+
 @app.route('/api/pin/<int:pin>/peripheral', methods=['POST'])
 def toggle_peripheral(pin):
     """Toggle pin peripheral mode"""
-    global pin_changes
-
-    if pin not in GPIO_PINS:
+    count_user_action()
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     available_modes = pin_states[pin].get('available_modes', ['GPIO'])
@@ -502,37 +817,37 @@ def toggle_peripheral(pin):
         new_mode = available_modes[0]
 
     # Attempt to enable/disable peripheral at runtime using dtparam
-    # Use sudo if not running as root
-    try:
-        if new_mode == 'GPIO':
-            # Disable all peripherals for this pin (return to GPIO mode)
-            # Note: This is simplified - actual implementation would need to know
-            # which specific peripheral to disable
-            pass
-        elif 'I2C' in new_mode:
-            # Enable I2C at runtime
-            subprocess.run(SUDO_PREFIX + ['dtparam', 'i2c_arm=on'], check=True, capture_output=True)
-            subprocess.run(SUDO_PREFIX + ['modprobe', 'i2c-dev'], check=False, capture_output=True)
-            subprocess.run(SUDO_PREFIX + ['modprobe', 'i2c-bcm2835'], check=False, capture_output=True)
-            print(f"Enabled I2C for pin {pin}")
-        elif 'SPI' in new_mode:
-            # Enable SPI at runtime
-            subprocess.run(SUDO_PREFIX + ['dtparam', 'spi=on'], check=True, capture_output=True)
-            print(f"Enabled SPI for pin {pin}")
-        elif 'UART' in new_mode:
-            # UART enabling is more complex, may require reboot
-            pass
-        # PWM and PCM can be controlled via software without dtparam
-    except subprocess.CalledProcessError as e:
-        stderr_msg = e.stderr.decode().strip() if e.stderr else str(e)
-        print(f"Warning: Could not enable {new_mode} for pin {pin}: {stderr_msg}")
-        # Continue anyway - show the mode even if activation failed
-    except Exception as e:
-        print(f"Warning: Could not enable {new_mode} for pin {pin}: {e}")
-        # Continue anyway - show the mode even if activation failed
+    # Use sudo if not running as root. dtparam/modprobe are idempotent but
+    # forking them is not free, so each peripheral is enabled at most once
+    # per server run (tracked in _enabled_peripherals), and the commands
+    # run on the background worker so the handler doesn't block on modprobe
+    if new_mode == 'GPIO':
+        # Disable all peripherals for this pin (return to GPIO mode)
+        # Note: This is simplified - actual implementation would need to know
+        # which specific peripheral to disable
+        pass
+    elif 'I2C' in new_mode:
+        # Enable I2C at runtime
+        if 'I2C' not in _enabled_peripherals:
+            _enabled_peripherals.add('I2C')
+            # modprobe failures are tolerated (modules may be built in)
+            _sys_worker.submit(
+                _run_peripheral_command, 'I2C', pin,
+                'dtparam i2c_arm=on && { modprobe i2c-dev; modprobe i2c-bcm2835; true; }')
+    elif 'SPI' in new_mode:
+        # Enable SPI at runtime
+        if 'SPI' not in _enabled_peripherals:
+            _enabled_peripherals.add('SPI')
+            _sys_worker.submit(_run_peripheral_command, 'SPI', pin,
+                               'dtparam spi=on')
+    elif 'UART' in new_mode:
+        # UART enabling is more complex, may require reboot
+        pass
+    # PWM and PCM can be controlled via software without dtparam
 
     pin_states[pin]['peripheral_mode'] = new_mode
-    pin_changes += 1
+    pin_changes.increment()
+    mark_pins_dirty()
 
     return jsonify({
         'success': True,
@@ -544,14 +859,10 @@ def toggle_peripheral(pin):
 @app.route('/api/reset', methods=['POST'])
 def reset_all():
     """Reset all pins to LOW output for safety - removes all components"""
-    global pin_changes
-
+    count_user_action()
     # Stop and remove all components first
-    for pin in list(component_running.keys()):
-        component_running[pin] = False
-        if pin in component_threads:
-            component_threads[pin].join()
-            del component_threads[pin]
+    for pin in list(component_stop_events.keys()):
+        stop_component_thread(pin)
 
     # Remove all components from registry
     for pin in list(component_registry.instances.keys()):
@@ -560,38 +871,65 @@ def reset_all():
     # Clear component data
     component_data.clear()
 
-    # Reset all GPIO pins
-    for pin in GPIO_PINS.keys():
-        # Stop flashing
-        if pin_states[pin]['flashing']:
-            flashing_pins[pin] = False
-            if pin in flash_threads:
-                flash_threads[pin].join()
-
+    # Reset all GPIO pins, driving them LOW with one batched write
+    all_pins = list(GPIO_PINS.keys())
+    for pin in all_pins:
+        stop_flashing(pin, turn_off=False)
         ensure_pin_setup(pin, 'OUT')
-        GPIO.output(pin, GPIO.LOW)
+    GPIO.output(all_pins, GPIO.LOW)
 
-        # Reset pin state
-        pin_states[pin]['mode'] = 'OUT'
-        pin_states[pin]['state'] = 0
-        pin_states[pin]['flashing'] = False
-        pin_states[pin]['component'] = False
-        pin_changes += 1
+    with pin_states_lock:
+        for pin in all_pins:
+            set_pin_mode_state(pin, 'OUT')
+            pin_states[pin]['state'] = 0
+            pin_states[pin]['flashing'] = False
+            pin_states[pin]['component'] = False
+            pin_changes.increment()
 
+    mark_pins_dirty()
     return jsonify({'success': True})
 
+def read_git_commit():
+    """Read the short git commit hash (run once at startup)
+
+    Reads .git directly instead of forking git - a fork+exec of the git
+    binary costs tens to hundreds of ms on a Pi Zero just to fetch a
+    7-character string.
+    """
+    try:
+        git_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.git')
+        with open(os.path.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+
+        if head.startswith('ref: '):
+            ref = head[5:]
+            try:
+                with open(os.path.join(git_dir, ref)) as f:
+                    return f.read().strip()[:7]
+            except FileNotFoundError:
+                # Ref may only exist in packed-refs
+                with open(os.path.join(git_dir, 'packed-refs')) as f:
+                    for line in f:
+                        if line.endswith(ref + '\n') and not line.startswith('#'):
+                            return line[:7]
+                return 'unknown'
+        # Detached HEAD holds the hash itself
+        return head[:7]
+    except Exception:
+        return 'unknown'
+
+# Cached at startup - the hash cannot change while the server is running
+GIT_COMMIT_HASH = read_git_commit()
+
 @app.route('/api/version', methods=['GET'])
 def get_version():
     """Get git version information"""
-    try:
-        commit_hash = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('ascii').strip()
-        return jsonify({'commit_hash': commit_hash})
-    except Exception as e:
-        return jsonify({'commit_hash': 'unknown'})
+    return jsonify({'commit_hash': GIT_COMMIT_HASH})
 
 @app.route('/api/config/save', methods=['POST'])
 def api_save_config():
     """API endpoint to save configuration"""
+    count_user_action()
     data = request.json or {}
     filename = data.get('filename', 'config.yaml')
 
@@ -604,6 +942,7 @@ def api_save_config():
 @app.route('/api/config/load', methods=['POST'])
 def api_load_config():
     """API endpoint to load configuration"""
+    count_user_action()
     data = request.json or {}
     filename = data.get('filename', 'config.yaml')
 
@@ -616,67 +955,62 @@ def api_load_config():
 @app.route('/api/config/list', methods=['GET'])
 def api_list_configs():
     """API endpoint to list available configurations"""
+    count_user_action()
     config_dir = 'configs'
     if not os.path.exists(config_dir):
         return jsonify({'configs': []})
 
-    configs = [f for f in os.listdir(config_dir) if f.endswith('.yaml') or f.endswith('.yml')]
+    # scandir avoids a stat() per entry compared with listdir+filter
+    with os.scandir(config_dir) as entries:
+        configs = [e.name for e in entries if e.name.endswith(('.yaml', '.yml'))]
     return jsonify({'configs': configs})
 
 @app.route('/api/clock/toggle', methods=['POST'])
 def toggle_clock():
     """Toggle clock display on/off"""
-    global clock_running, clock_thread, pin_changes
+    count_user_action()
+    global clock_running, clock_thread
 
     if clock_running:
         # Stop the clock
         clock_running = False
+        clock_stop_event.set()
         if clock_thread:
             clock_thread.join()
             clock_thread = None
 
         # Turn off all clock pins
-        all_clock_pins = get_all_clock_pins()
-
-        for pin in all_clock_pins:
-            if pin in GPIO_PINS:
-                # Stop any flashing first
-                if pin_states[pin].get('flashing', False):
-                    flashing_pins[pin] = False
-                    if pin in flash_threads:
-                        flash_threads[pin].join()
-                    pin_states[pin]['flashing'] = False
+        for pin in ALL_CLOCK_PINS:
+            # Stop any flashing first
+            stop_flashing(pin, turn_off=False)
 
-                ensure_pin_setup(pin, 'OUT')
-                GPIO.output(pin, GPIO.LOW)
-                pin_states[pin]['state'] = 0
+            ensure_pin_setup(pin, 'OUT')
+            GPIO.output(pin, GPIO.LOW)
+            pin_states[pin]['state'] = 0
 
+        mark_pins_dirty()
         return jsonify({'success': True, 'clock_running': False})
     else:
         # Start the clock
         # First stop any flashing on pins we'll use
-        all_clock_pins = get_all_clock_pins()
-
-        for pin in all_clock_pins:
-            if pin in GPIO_PINS and pin_states[pin].get('flashing', False):
-                flashing_pins[pin] = False
-                if pin in flash_threads:
-                    flash_threads[pin].join()
-                pin_states[pin]['flashing'] = False
+        for pin in ALL_CLOCK_PINS:
+            if not pin_states[pin].get('component', False):
+                stop_flashing(pin, turn_off=False)
+                ensure_pin_setup(pin, 'OUT')
+                set_pin_mode_state(pin, 'OUT')
 
         clock_running = True
+        clock_stop_event.clear()
         clock_thread = threading.Thread(target=clock_display_thread)
         clock_thread.daemon = True
         clock_thread.start()
-        pin_changes += 1
+        pin_changes.increment()
 
         return jsonify({'success': True, 'clock_running': True})
 
 @app.route('/api/component/assign', methods=['POST'])
 def assign_component():
     """Assign a component to a pin"""
-    global pin_changes
-
     data = request.json
     pin = data.get('pin')
     component_type = data.get('component_type')
@@ -684,22 +1018,14 @@ def assign_component():
     gpio_pins = data.get('gpio_pins', {'data': pin})
     config = data.get('config', {})
 
-    if pin not in GPIO_PINS:
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     # Stop any existing component on this pin
-    if pin in component_running:
-        component_running[pin] = False
-        if pin in component_threads:
-            component_threads[pin].join()
-            del component_threads[pin]
+    stop_component_thread(pin)
 
     # Stop any flashing on this pin
-    if pin_states[pin].get('flashing', False):
-        flashing_pins[pin] = False
-        if pin in flash_threads:
-            flash_threads[pin].join()
-        pin_states[pin]['flashing'] = False
+    stop_flashing(pin, turn_off=False)
 
     # Clean up GPIO only if NOT a DHT sensor component
     # DHT sensors use Adafruit_DHT which does its own low-level GPIO access
@@ -711,16 +1037,18 @@ def assign_component():
             GPIO.setmode(GPIO.BOARD)
         except:
             pass  # Ignore if pin wasn't set up
+        _pin_setup_mode.pop(pin, None)
 
     # Convert BOARD pin numbers to BCM for components that require BCM numbering
     # (e.g., Adafruit_DHT library only uses BCM)
-    if component_type in ['dht22', 'dht11']:
+    if component_type in DHT_COMPONENT_TYPES:
         # Convert data pin from BOARD to BCM
         if 'data' in gpio_pins:
             board_pin = gpio_pins['data']
             bcm_pin = BOARD_TO_BCM.get(board_pin, board_pin)
             gpio_pins['data'] = bcm_pin
-            print(f"{component_type.upper()}: Converting BOARD pin {board_pin} → BCM GPIO {bcm_pin}")
+            logger.debug("%s: converting BOARD pin %s -> BCM GPIO %s",
+                         component_type, board_pin, bcm_pin)
 
     # Create and assign component
     component = component_registry.create_component(component_type, name, gpio_pins, config)
@@ -731,14 +1059,16 @@ def assign_component():
     component_registry.assign_component(pin, component)
 
     # Update pin state
-    pin_states[pin]['mode'] = component_type.upper()
+    set_pin_mode_state(pin, component_type.upper())
     pin_states[pin]['component'] = True
-    pin_changes += 1
+    pin_changes.increment()
+    mark_pins_dirty()
 
     # Start reading thread for producer components
     if hasattr(component, 'read'):
-        component_running[pin] = True
-        thread = threading.Thread(target=component_read_thread, args=(pin,))
+        stop_event = threading.Event()
+        component_stop_events[pin] = stop_event
+        thread = threading.Thread(target=component_read_thread, args=(pin, stop_event))
         thread.daemon = True
         component_threads[pin] = thread
         thread.start()
@@ -753,7 +1083,7 @@ def assign_component():
 @app.route('/api/component/<int:pin>/data', methods=['GET'])
 def get_component_data(pin):
     """Get current component data for a pin"""
-    if pin not in GPIO_PINS:
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     component = component_registry.get_component(pin)
@@ -766,7 +1096,7 @@ def get_component_data(pin):
     return jsonify({
         'success': True,
         'pin': pin,
-        'running': component_running.get(pin, False),
+        'running': pin in component_threads,
         'component_type': component.__class__.__name__,
         'data': data
     })
@@ -774,25 +1104,20 @@ def get_component_data(pin):
 @app.route('/api/component/<int:pin>/remove', methods=['POST'])
 def remove_component(pin):
     """Remove component from a pin"""
-    global pin_changes
-
-    if pin not in GPIO_PINS:
+    if pin not in GPIO_PIN_SET:
         return jsonify({'error': 'Invalid pin'}), 400
 
     # Stop reading thread if running
-    if pin in component_running:
-        component_running[pin] = False
-        if pin in component_threads:
-            component_threads[pin].join()
-            del component_threads[pin]
+    stop_component_thread(pin)
 
     # Remove component from registry
     component_registry.remove_component(pin)
 
     # Reset pin to normal input mode
-    pin_states[pin]['mode'] = 'IN'
+    set_pin_mode_state(pin, 'IN')
     pin_states[pin]['component'] = False
-    pin_changes += 1
+    pin_changes.increment()
+    mark_pins_dirty()
 
     # Clean up component data
     if pin in component_data:
@@ -800,8 +1125,31 @@ def remove_component(pin):
 
     return jsonify({'success': True, 'pin': pin, 'running': False})
 
+# PyYAML is only needed for config save/load, which many sessions never
+# touch, so defer the import (a sizeable chunk of code and RSS on a Pi
+# Zero) until the first config operation
+yaml = None
+YamlLoader = None
+YamlDumper = None
+
+def _import_yaml():
+    """Import PyYAML on first use, preferring libyaml's C loader/dumper"""
+    global yaml, YamlLoader, YamlDumper
+    if yaml is None:
+        import yaml as _yaml
+        try:
+            from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+        except ImportError:
+            from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+        yaml, YamlLoader, YamlDumper = _yaml, _Loader, _Dumper
+
+# Set once the configs/ directory is known to exist, so saves skip the
+# repeated makedirs
+_configs_dir_ready = False
+
 def save_configuration(filename='config.yaml'):
     """Save current pin configuration to YAML file"""
+    _import_yaml()
     config = {
         'pins': {},
         'components': {}
@@ -828,18 +1176,26 @@ def save_configuration(filename='config.yaml'):
         }
 
     config_dir = 'configs'
-    os.makedirs(config_dir, exist_ok=True)
+    global _configs_dir_ready
+    if not _configs_dir_ready:
+        os.makedirs(config_dir, exist_ok=True)
+        _configs_dir_ready = True
     filepath = os.path.join(config_dir, filename)
 
-    with open(filepath, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+    # Serialize in memory and rename into place so a crash mid-write
+    # never leaves a truncated config behind
+    buf = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False)
+    tmppath = filepath + '.tmp'
+    with open(tmppath, 'w') as f:
+        f.write(buf)
+    os.replace(tmppath, filepath)
 
     print(f"Configuration saved to {filepath}")
     return filepath
 
 def load_configuration(filename='config.yaml'):
     """Load pin configuration from YAML file"""
-    global pin_changes
+    _import_yaml()
     config_dir = 'configs'
     filepath = os.path.join(config_dir, filename)
 
@@ -848,35 +1204,39 @@ def load_configuration(filename='config.yaml'):
         return False
 
     with open(filepath, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
 
     if 'pins' not in config:
         print("Invalid configuration file format")
         return False
 
-    # Apply pin configuration
-    for pin, settings in config['pins'].items():
-        pin = int(pin)
-        if pin in GPIO_PINS:
-            # Set mode
-            mode = settings.get('mode', 'OUT')
-            if mode == 'OUT':
-                ensure_pin_setup(pin, 'OUT')
-                GPIO.output(pin, GPIO.HIGH if settings.get('state', 0) else GPIO.LOW)
-            else:
-                GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-
-            # Update state
-            pin_states[pin]['mode'] = mode
-            pin_states[pin]['state'] = settings.get('state', 0)
-            pin_states[pin]['peripheral_mode'] = settings.get('peripheral_mode', 'GPIO')
-            pin_states[pin]['flash_speed'] = settings.get('flash_speed', 500)
-
-    # Restore component assignments
+    # Apply pin configuration; normalize and validate the pin keys once
+    # before taking the lock
+    pin_settings = [(int(p), settings) for p, settings in config['pins'].items()]
+    with pin_states_lock:
+        for pin, settings in pin_settings:
+            if pin in GPIO_PIN_SET:
+                # Set mode
+                mode = settings.get('mode', 'OUT')
+                if mode == 'OUT':
+                    ensure_pin_setup(pin, 'OUT')
+                    GPIO.output(pin, GPIO.HIGH if settings.get('state', 0) else GPIO.LOW)
+                else:
+                    ensure_pin_setup(pin, 'IN')
+
+                # Update state
+                set_pin_mode_state(pin, mode)
+                pin_states[pin]['state'] = settings.get('state', 0)
+                pin_states[pin]['peripheral_mode'] = settings.get('peripheral_mode', 'GPIO')
+                pin_states[pin]['flash_speed'] = settings.get('flash_speed', 500)
+
+    # Restore component assignments; convert and validate the pin keys
+    # once up front instead of per loop iteration
     if 'components' in config:
-        for pin, comp_info in config['components'].items():
-            pin = int(pin)
-            if pin not in GPIO_PINS:
+        components = {int(p): info for p, info in config['components'].items()}
+        started = []
+        for pin, comp_info in components.items():
+            if pin not in GPIO_PIN_SET:
                 continue
 
             component_type = comp_info.get('type')
@@ -885,31 +1245,35 @@ def load_configuration(filename='config.yaml'):
             comp_config = comp_info.get('config', {})
 
             # Convert data pin from BOARD to BCM for DHT sensors
-            if component_type in ['dht22', 'dht11']:
-                if 'data' in gpio_pins:
-                    board_pin = gpio_pins['data']
-                    bcm_pin = BOARD_TO_BCM.get(board_pin, board_pin)
-                    gpio_pins['data'] = bcm_pin
-                    print(f"{component_type.upper()}: Converting BOARD pin {board_pin} → BCM GPIO {bcm_pin}")
+            if component_type in DHT_COMPONENT_TYPES and 'data' in gpio_pins:
+                board_pin = gpio_pins['data']
+                gpio_pins['data'] = BOARD_TO_BCM.get(board_pin, board_pin)
 
             # Create and assign component
             component = component_registry.create_component(component_type, name, gpio_pins, comp_config)
 
             if component:
                 component_registry.assign_component(pin, component)
-                pin_states[pin]['mode'] = component_type.upper()
+                set_pin_mode_state(pin, component_type.upper())
                 pin_states[pin]['component'] = True
-                pin_changes += 1
+                pin_changes.increment()
 
                 # Start reading thread for producer components
                 if hasattr(component, 'read'):
-                    component_running[pin] = True
-                    thread = threading.Thread(target=component_read_thread, args=(pin,))
+                    stop_event = threading.Event()
+                    component_stop_events[pin] = stop_event
+                    thread = threading.Thread(target=component_read_thread, args=(pin, stop_event))
                     thread.daemon = True
                     component_threads[pin] = thread
                     thread.start()
-                    print(f"Started component thread for {component_type} on pin {pin}")
+                    started.append((component_type, pin))
+
+        # One summary line instead of a print per component
+        if started:
+            print("Started component threads: " +
+                  ", ".join(f"{ctype} on pin {pin}" for ctype, pin in started))
 
+    mark_pins_dirty()
     print(f"Configuration loaded from {filepath}")
     return True
 
@@ -920,24 +1284,34 @@ def cleanup():
     # Stop clock if running
     if clock_running:
         clock_running = False
+        clock_stop_event.set()
         if clock_thread:
             clock_thread.join()
 
     # Stop all component reading threads
-    for pin in list(component_running.keys()):
-        component_running[pin] = False
+    for event in component_stop_events.values():
+        event.set()
     for thread in component_threads.values():
         thread.join()
 
     # Cleanup all components
     component_registry.cleanup_all()
 
-    # Stop all flashing
-    for pin in flashing_pins.keys():
-        flashing_pins[pin] = False
+    # Stop all flashing and the shared flash loop
+    for pin in GPIO_PINS.keys():
+        stop_flashing(pin, turn_off=False)
+    flash_loop.call_soon_threadsafe(flash_loop.stop)
 
     GPIO.cleanup()
 
+# Device-tree locations that expose HAT EEPROM fields
+HAT_PATHS = (
+    '/proc/device-tree/hat/product',
+    '/proc/device-tree/hat/vendor',
+    '/sys/firmware/devicetree/base/hat/product',
+    '/sys/firmware/devicetree/base/hat/vendor'
+)
+
 def detect_hat():
     """
     Detect if a HAT is connected by checking for HAT EEPROM
@@ -945,16 +1319,8 @@ def detect_hat():
     """
     try:
         # Check for HAT device tree overlay
-        import os
-        hat_paths = [
-            '/proc/device-tree/hat/product',
-            '/proc/device-tree/hat/vendor',
-            '/sys/firmware/devicetree/base/hat/product',
-            '/sys/firmware/devicetree/base/hat/vendor'
-        ]
-
         hat_info = {}
-        for path in hat_paths:
+        for path in HAT_PATHS:
             if os.path.exists(path):
                 try:
                     with open(path, 'r') as f:
@@ -979,6 +1345,36 @@ def detect_hat():
     except Exception as e:
         return False, f"Detection error: {str(e)}"
 
+# HAT presence can't change without a reboot, so the probe result is
+# cached in /run (tmpfs, cleared on boot) and later starts skip the
+# filesystem probes entirely
+HAT_CACHE_FILE = '/run/gpioviz/hat_info.json'
+
+def detect_hat_cached(use_cache=True):
+    """Detect a HAT, reusing the cached result from a previous start"""
+    if use_cache:
+        try:
+            with open(HAT_CACHE_FILE) as f:
+                cached = json.load(f)
+            return cached['detected'], cached['info']
+        except Exception:
+            pass
+
+    detected, info = detect_hat()
+
+    if use_cache:
+        # Best-effort atomic write; detection still works without /run
+        try:
+            os.makedirs(os.path.dirname(HAT_CACHE_FILE), exist_ok=True)
+            tmppath = HAT_CACHE_FILE + '.tmp'
+            with open(tmppath, 'w') as f:
+                json.dump({'detected': detected, 'info': info}, f)
+            os.replace(tmppath, HAT_CACHE_FILE)
+        except Exception:
+            pass
+
+    return detected, info
+
 if __name__ == '__main__':
     import logging
 
@@ -986,6 +1382,7 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Raspberry Pi GPIO Visualizer')
     parser.add_argument('--load-config', type=str, help='Load configuration from YAML file on startup')
     parser.add_argument('--port', type=int, default=5000, help='Port to run the web server on (default: 5000)')
+    parser.add_argument('--no-hat-cache', action='store_true', help='Re-probe HAT detection instead of using the cached result')
     args = parser.parse_args()
 
     # Disable werkzeug logging
@@ -999,13 +1396,7 @@ if __name__ == '__main__':
 
     try:
         # Detect HAT
-        hat_detected, hat_info = detect_hat()
-
-        # Get git commit hash
-        try:
-            commit_hash = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('ascii').strip()
-        except Exception:
-            commit_hash = 'unknown'
+        hat_detected, hat_info = detect_hat_cached(use_cache=not args.no_hat_cache)
 
         print("\n" + "="*70)
         print("  Raspberry Pi GPIO Visualizer")
@@ -1014,14 +1405,25 @@ if __name__ == '__main__':
             print(f"  HAT: ✓ {hat_info}")
         else:
             print(f"  HAT: ✗ {hat_info}")
-        print(f"  Git commit: {commit_hash}")
+        print(f"  Git commit: {GIT_COMMIT_HASH}")
         if args.load_config:
             print(f"  Loaded config: {args.load_config}")
         print("="*70 + "\n")
         sys.stderr.write("\n")  # Add newline before status starts
         sys.stderr.flush()
         update_status_line()  # Show "ready" message
-        app.run(host='0.0.0.0', port=args.port, debug=False, use_reloader=False)
+
+        # Prefer waitress when installed: a fixed worker pool handles the
+        # continuous /api/pins polling without per-request thread churn.
+        # Fall back to the Flask dev server if waitress is not available.
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=args.port, threads=4)
+        except ImportError:
+            # threaded=False keeps the fallback dev server single-threaded
+            # (its default) rather than spawning a thread per request
+            app.run(host='0.0.0.0', port=args.port, debug=False,
+                    use_reloader=False, threaded=False)
     except KeyboardInterrupt:
         print("\n\nShutting down...")
         cleanup()
@@ -21,7 +21,7 @@ class ProducerComponent:
         self.config = config or {}
         self.outputs = {}  # Output schema defined by subclass
         self.tested = False
-        logger.info(f"Initialized {self.__class__.__name__} '{name}'")
+        logger.info("Initialized %s '%s'", self.__class__.__name__, name)
 
     def read(self) -> Dict[str, Any]:
         """
@@ -76,7 +76,7 @@ class ConsumerComponent:
         self.config = config or {}
         self.inputs = {}  # Input schema defined by subclass
         self.tested = False
-        logger.info(f"Initialized {self.__class__.__name__} '{name}'")
+        logger.info("Initialized %s '%s'", self.__class__.__name__, name)
 
     def write(self, data: dict):
         """
@@ -0,0 +1,138 @@
+"""
+Shared implementation for DHT-family temperature and humidity sensors
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+try:
+    import Adafruit_DHT
+    DHT_AVAILABLE = True
+except ImportError:
+    DHT_AVAILABLE = False
+
+from ..base import ProducerComponent
+
+logger = logging.getLogger(__name__)
+
+
+class DHTComponent(ProducerComponent):
+    """
+    Base class for DHT-family temperature and humidity sensors
+
+    DHT11 and DHT22 share the same wire protocol and driver; subclasses
+    only set SENSOR_NAME, SENSOR_TYPE and the valid reading ranges.
+
+    Provides:
+    - temperature (°C)
+    - humidity (%)
+    """
+
+    SENSOR_NAME = 'DHT'
+    SENSOR_TYPE = None
+    TEMP_RANGE = (-40, 80)
+    HUMIDITY_RANGE = (0, 100)
+
+    def __init__(self, name: str, gpio_pins: dict, config: Optional[dict] = None):
+        super().__init__(name, gpio_pins, config)
+
+        if not DHT_AVAILABLE:
+            raise ImportError("Adafruit_DHT library not available")
+
+        self.data_pin = gpio_pins.get('data')
+        if not self.data_pin:
+            raise ValueError(f"{self.SENSOR_NAME} requires 'data' pin in gpio_pins")
+
+        # Configuration
+        self.polling_interval = self.config.get('polling', 2)  # seconds
+        self.retries = self.config.get('retries', 3)
+
+        # Output schema
+        self.outputs = {
+            'temperature': {
+                'type': 'float',
+                'unit': '°C',
+                'range': list(self.TEMP_RANGE)
+            },
+            'humidity': {
+                'type': 'float',
+                'unit': '%',
+                'range': list(self.HUMIDITY_RANGE)
+            }
+        }
+
+        logger.info("%s '%s' initialized on GPIO %s (retries=%d, polling=%ds)",
+                    self.SENSOR_NAME, name, self.data_pin, self.retries, self.polling_interval)
+
+    def read(self) -> Dict[str, Optional[float]]:
+        """
+        Read temperature and humidity from sensor
+
+        Returns:
+            dict with 'temperature' and 'humidity' keys
+            Values are None if read failed
+        """
+        try:
+            start_time = time.time()
+
+            # Let the driver retry internally with a 1s delay between
+            # attempts (the old hand-rolled loop slept 2s per retry)
+            humidity, temperature = Adafruit_DHT.read_retry(
+                self.SENSOR_TYPE,
+                self.data_pin,
+                retries=self.retries,
+                delay_seconds=1
+            )
+
+            elapsed = time.time() - start_time
+
+            if humidity is not None and temperature is not None:
+                logger.debug("%s '%s': %.1f°C, %.1f%% (took %.1fs)",
+                             self.SENSOR_NAME, self.name, temperature, humidity, elapsed)
+                return {
+                    'temperature': round(temperature, 1),
+                    'humidity': round(humidity, 1)
+                }
+            else:
+                logger.warning("%s '%s': failed to read sensor after %d attempts (took %.1fs)",
+                               self.SENSOR_NAME, self.name, self.retries, elapsed)
+                return {
+                    'temperature': None,
+                    'humidity': None
+                }
+
+        except Exception as e:
+            logger.error("%s '%s': error reading sensor: %s", self.SENSOR_NAME, self.name, e)
+            return {
+                'temperature': None,
+                'humidity': None
+            }
+
+    def test(self) -> bool:
+        """
+        Test if sensor is responding
+
+        Returns:
+            True if sensor reads successfully, False otherwise
+        """
+        logger.info("Testing %s '%s'...", self.SENSOR_NAME, self.name)
+
+        data = self.read()
+
+        if data['temperature'] is not None and data['humidity'] is not None:
+            # Validate readings are within the sensor's rated range
+            temp_valid = self.TEMP_RANGE[0] <= data['temperature'] <= self.TEMP_RANGE[1]
+            humidity_valid = self.HUMIDITY_RANGE[0] <= data['humidity'] <= self.HUMIDITY_RANGE[1]
+
+            if temp_valid and humidity_valid:
+                logger.info("%s '%s': Test PASSED", self.SENSOR_NAME, self.name)
+                self.tested = True
+                return True
+            else:
+                logger.warning("%s '%s': Test FAILED - readings out of range",
+                               self.SENSOR_NAME, self.name)
+                return False
+        else:
+            logger.warning("%s '%s': Test FAILED - no response", self.SENSOR_NAME, self.name)
+            return False
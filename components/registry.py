@@ -5,7 +5,8 @@ Component registry for managing hardware components
 import json
 import os
 import logging
-from typing import Dict, Optional, Type, Any
+from types import MappingProxyType
+from typing import Mapping, Optional, Type, Any
 from .base import ProducerComponent, ConsumerComponent
 
 logger = logging.getLogger(__name__)
@@ -30,9 +31,9 @@ class ComponentRegistry:
         try:
             with open(filepath, 'r') as f:
                 self.definitions = json.load(f)
-            logger.info(f"Loaded {len(self.definitions)} component definitions")
+            logger.info("Loaded %d component definitions", len(self.definitions))
         except Exception as e:
-            logger.error(f"Failed to load component definitions: {e}")
+            logger.error("Failed to load component definitions: %s", e)
             self.definitions = {}
 
     def register_class(self, component_type: str, component_class: Type):
@@ -44,7 +45,7 @@ class ComponentRegistry:
             component_class: Component class (must inherit from ProducerComponent or ConsumerComponent)
         """
         self.component_classes[component_type] = component_class
-        logger.debug(f"Registered component class: {component_type}")
+        logger.debug("Registered component class: %s", component_type)
 
     def create_component(self, component_type: str, name: str, gpio_pins: dict,
                         config: Optional[dict] = None) -> Optional[Any]:
@@ -61,7 +62,7 @@ class ComponentRegistry:
             Component instance or None if creation failed
         """
         if component_type not in self.component_classes:
-            logger.error(f"Unknown component type: {component_type}")
+            logger.error("Unknown component type: %s", component_type)
             return None
 
         try:
@@ -69,7 +70,7 @@ class ComponentRegistry:
             instance = component_class(name, gpio_pins, config)
             return instance
         except Exception as e:
-            logger.error(f"Failed to create {component_type} component: {e}")
+            logger.error("Failed to create %s component: %s", component_type, e)
             return None
 
     def assign_component(self, pin: int, component: Any):
@@ -85,7 +86,7 @@ class ComponentRegistry:
             self.remove_component(pin)
 
         self.instances[pin] = component
-        logger.info(f"Assigned {component.name} to pin {pin}")
+        logger.info("Assigned %s to pin %d", component.name, pin)
 
     def get_component(self, pin: int) -> Optional[Any]:
         """
@@ -110,16 +111,17 @@ class ComponentRegistry:
             component = self.instances[pin]
             component.cleanup()
             del self.instances[pin]
-            logger.info(f"Removed component from pin {pin}")
+            logger.info("Removed component from pin %d", pin)
 
-    def get_all_components(self) -> Dict[int, Any]:
+    def get_all_components(self) -> Mapping[int, Any]:
         """
         Get all component instances
 
         Returns:
-            dict mapping pin -> component
+            read-only view mapping pin -> component; callers that need
+            a mutable snapshot should copy it themselves
         """
-        return self.instances.copy()
+        return MappingProxyType(self.instances)
 
     def get_definition(self, component_type: str) -> Optional[dict]:
         """
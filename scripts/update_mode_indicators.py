@@ -1,23 +1,51 @@
+import os
 import re
 
-with open('/home/peter/gpioviz/templates/index.html', 'r') as f:
-    html = f.read()
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'templates', 'index.html')
 
-# Replace the pin-mode divs with pin-mode-indicator
-gpio_pins = [3, 5, 7, 8, 10, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40]
+# The block being removed is a fixed literal per pin (the scripts in
+# this directory wrote it with this exact indentation), so match the 26
+# exact literals with one alternation of escaped strings - no \s*
+# tokenizing or capture bookkeeping - still in a single pass and copy.
+# Compiled once at module scope so re-running main() (or importing the
+# module) never recompiles it
+GPIO_PINS = (3, 5, 7, 8, 10, 11, 12, 13, 15, 16, 18, 19, 21, 22, 23, 24, 26, 29, 31, 32, 33, 35, 36, 37, 38, 40)
 
-for pin in gpio_pins:
-    # Find and replace the radio button section
-    old_pattern = f'''<div class="pin-mode">
-                            <label><input type="radio" name="mode-{pin}" value="OUT" checked onchange="setMode({pin}, 'OUT')">O</label>
-                            <label><input type="radio" name="mode-{pin}" value="IN" onchange="setMode({pin}, 'IN')">I</label>
+OLD_BLOCK = b'''<div class="pin-mode">
+                            <label><input type="radio" name="mode-%d" value="OUT" checked onchange="setMode(%d, 'OUT')">O</label>
+                            <label><input type="radio" name="mode-%d" value="IN" onchange="setMode(%d, 'IN')">I</label>
                         </div>'''
-    
-    new_pattern = f'<div class="pin-mode-indicator output-mode"></div>'
-    
-    html = html.replace(old_pattern, new_pattern)
 
-with open('/home/peter/gpioviz/templates/index.html', 'w') as f:
-    f.write(html)
+PIN_MODE_RE = re.compile(b'|'.join(
+    re.escape(OLD_BLOCK % (pin, pin, pin, pin)) for pin in GPIO_PINS))
 
-print("Updated all GPIO pins to use mode indicators")
+
+def main():
+    # The template is ASCII, so work in bytes: no decode/encode round
+    # trip and re uses its byte-matching fast path
+    with open(TEMPLATE_PATH, 'rb') as f:
+        html = f.read()
+
+    # Replace the pin-mode divs with pin-mode-indicator
+    rewritten = PIN_MODE_RE.sub(b'<div class="pin-mode-indicator output-mode"></div>', html)
+
+    # Re-runs on an already-updated template are no-ops; skip the write
+    # so the file's mtime does not churn downstream build steps
+    if rewritten == html:
+        print("Template already up to date, nothing written")
+        return
+
+    # One os.write of the whole blob through the raw fd; no buffered
+    # writer needed for a single in-memory buffer
+    fd = os.open(TEMPLATE_PATH, os.O_WRONLY | os.O_TRUNC | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, rewritten)
+    finally:
+        os.close(fd)
+
+    print("Updated all GPIO pins to use mode indicators")
+
+
+if __name__ == '__main__':
+    main()